@@ -5,8 +5,7 @@ async def main():
     """
     An example of how to use the InstantDomainsClient.
     """
-    client = InstantDomainsClient()
-    try:
+    async with InstantDomainsClient() as client:
         # It's important to run the warmup sequence to initialize the session
         await client.warmup()
         
@@ -25,8 +24,5 @@ async def main():
             status = "Available" if result.is_available else "Taken"
             print(f"{result.domain}: {status}")
 
-    finally:
-        await client.close()
-
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
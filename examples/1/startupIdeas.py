@@ -129,6 +129,9 @@ async def main(startup_idea: str, allowed_tlds: Set[str], only_show_available: b
         tasks = [client.domain_search.search(idea.idea, allowed_tlds, get_suggestions=get_suggestions) for idea in ideas_from_gpt]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        # Match whole TLDs only (e.g. '.com' but not '.common'), checked in a single endswith call
+        tld_suffixes = tuple(f".{tld.lstrip('.')}" for tld in allowed_tlds)
+
         # Process results
         for res in results:
             if isinstance(res, Exception):
@@ -137,7 +140,7 @@ async def main(startup_idea: str, allowed_tlds: Set[str], only_show_available: b
 
             # Process main results (from AI idea + common TLDs)
             for domain_info in res.main_results:
-                if any(domain_info.domain.endswith(tld) for tld in allowed_tlds):
+                if domain_info.domain.endswith(tld_suffixes):
                     all_results_data[domain_info.domain] = {
                         "source": "AI-Generated",
                         "available": domain_info.is_available,
@@ -146,7 +149,7 @@ async def main(startup_idea: str, allowed_tlds: Set[str], only_show_available: b
             
             # Process suggested results (from InstantDomains)
             for domain_info in res.suggested_results:
-                if any(domain_info.domain.endswith(tld) for tld in allowed_tlds):
+                if domain_info.domain.endswith(tld_suffixes):
                     # Avoid overwriting if already present from main results
                     if domain_info.domain not in all_results_data:
                          all_results_data[domain_info.domain] = {
@@ -1,15 +1,18 @@
 import asyncio
 import os
-import json
 import logging
 import csv
+from functools import lru_cache
+from itertools import chain
 from typing import List, Set, Dict, Any
 from dotenv import load_dotenv
 import openai
+import orjson
 from pydantic import Field
 
 # Local project imports
 from instantdomains.client import InstantDomainsClient
+from instantdomains.api.domain_search.models import DomainSearchResults
 from schemic import SchemicModel
 
 # --- Logger Setup ---
@@ -27,7 +30,7 @@ load_dotenv()
 
 # Initialize the OpenAI client, handling potential missing API key
 try:
-    openai_client = openai.OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+    openai_client = openai.AsyncOpenAI(api_key=os.environ["OPENAI_API_KEY"])
 except KeyError:
     logger.error("FATAL: The 'OPENAI_API_KEY' environment variable is not set.")
     logger.error("Please create a .env file and add the key, then restart the script.")
@@ -42,25 +45,11 @@ class DomainNameIdeas(SchemicModel):
         description="A list of creative and brandable domain name ideas. These should be single words without the TLD (e.g., 'zenith', 'brightwork', 'catalyst')."
     )
 
-# --- Functions for AI Interaction ---
-
-def get_domain_ideas(prompt: str, num_ideas: int = 15) -> List[str]:
-    """
-    Uses GPT to generate a list of startup domain name ideas based on a user prompt.
-
-    Args:
-        prompt (str): The user's startup idea description.
-        num_ideas (int): The number of ideas to generate.
+# Models that spend reasoning tokens and accept `reasoning_effort`
+REASONING_MODEL_PREFIXES = ("o1", "o3", "o4", "gpt-5")
 
-    Returns:
-        List[str]: A list of domain name ideas (without TLDs).
-    """
-    logger.info(f"\nAsking AI for startup name ideas for: '{prompt}'...")
-    try:
-        response = openai_client.chat.completions.create(
-            model="o4-mini-2025-04-16",
-            messages=[
-                {"role": "system", "content": """You are an expert in branding and naming startups. Generate a diverse list of short, memorable, and unique names based on the user's idea.
+# Kept byte-identical across calls and sent first so OpenAI can reuse its prompt cache
+SYSTEM_PROMPT = """You are an expert in branding and naming startups. Generate a diverse list of short, memorable, and unique names based on the user's idea.
 
 To generate ideas, use the following techniques:
 0.  Exhaust all combinations of key terms in the description. Try using the terms most specific to the startup's industry. So for a company working in the logistics space, you might get 'LogisticsPro', 'CargoFlow', 'ShipSmart', 'FreightWise', etc. Not something like 'Fixify' or 'SuperFixer' or 'ServiceX'. Also adding the most common terms in the industry so for something in the car dealership space you might want to include terms like 'auto'.
@@ -73,22 +62,159 @@ To generate ideas, use the following techniques:
 3.  Avoid using generic terms like 'tech', 'solutions', 'systems', 'AI', 'assistant', & 'bot' unless they are part of the core idea.
 4.  Avoid using special characters like '-', '_'.
 5.  Avoid misspellings or overly complex names that are hard to remember or spell (including in most cases, the use of numbers, or removing all vowels in a name).
-"""},
+"""
+
+@lru_cache(maxsize=1)
+def domain_ideas_response_format() -> Dict[str, Any]:
+    """Builds the structured output schema once so every request sends identical bytes."""
+    return DomainNameIdeas.schemic_schema()
+
+# --- Functions for AI Interaction ---
+
+class IdeaStreamParser:
+    """
+    Incrementally extracts the strings of the `ideas` array from a streamed JSON completion.
+    """
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._buffer: List[str] = []
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Feeds the next piece of streamed content into the parser.
+
+        Args:
+            chunk (str): The next piece of the JSON completion.
+
+        Returns:
+            List[str]: The ideas completed by this chunk.
+        """
+        ideas = []
+        for char in chunk:
+            if self._in_string:
+                self._buffer.append(char)
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    # Strings inside {"ideas": [...]} sit two levels deep; the "ideas" key does not
+                    if self._depth == 2:
+                        ideas.append(orjson.loads("".join(self._buffer)))
+            elif char == '"':
+                self._in_string = True
+                self._buffer = [char]
+            elif char in "[{":
+                self._depth += 1
+            elif char in "]}":
+                self._depth -= 1
+        return ideas
+
+async def _stream_domain_ideas(prompt: str, ideas_queue: asyncio.Queue, num_ideas: int, model: str) -> int:
+    """
+    Streams a single completion of domain name ideas onto the queue.
+
+    Args:
+        prompt (str): The user's startup idea description.
+        ideas_queue (asyncio.Queue): The queue that receives each domain name idea (without TLDs).
+        num_ideas (int): The number of ideas to generate in this completion.
+        model (str): The OpenAI model to use.
+
+    Returns:
+        int: The number of ideas put on the queue.
+    """
+    num_generated = 0
+    if model.startswith(REASONING_MODEL_PREFIXES):
+        # Reasoning tokens add latency without improving a simple brainstorm, and they count
+        # towards max_completion_tokens, so leave room for them before the JSON starts
+        extra_args = {"reasoning_effort": "low"}
+        max_completion_tokens = max(2048, num_ideas * 20)
+    else:
+        extra_args = {}
+        max_completion_tokens = max(512, num_ideas * 8)
+    try:
+        stream = await openai_client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": f"My startup idea is: {prompt}. Please give me a list of {num_ideas} potential names."}
             ],
-            response_format=DomainNameIdeas.schemic_schema(),
+            response_format=domain_ideas_response_format(),
+            max_completion_tokens=max_completion_tokens,
+            stream=True,
+            **extra_args,
         )
-        content = response.choices[0].message.content
-        if content:
-            parsed_response = DomainNameIdeas(**json.loads(content))
-            logger.info(f"AI generated {len(parsed_response.ideas)} ideas.")
-            return parsed_response.ideas
+        parser = IdeaStreamParser()
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            if chunk.choices[0].finish_reason == "length":
+                logger.warning(f"AI response hit the {max_completion_tokens} token limit; some ideas were cut off.")
+            if not chunk.choices[0].delta.content:
+                continue
+            for idea in parser.feed(chunk.choices[0].delta.content):
+                await ideas_queue.put(idea)
+                num_generated += 1
     except Exception:
         logger.exception("Error getting domain ideas from AI.")
-    return []
+    return num_generated
+
+async def get_domain_ideas(prompt: str, ideas_queue: asyncio.Queue, num_ideas: int = 15, model: str = "gpt-4o-mini", ideas_per_call: int = 50) -> None:
+    """
+    Uses GPT to stream a list of startup domain name ideas based on a user prompt.
+    The ideas are split across concurrent completions of at most `ideas_per_call` ideas each.
+    Each idea is put on the queue as soon as it is parsed, followed by `None` once every stream ends.
+
+    Args:
+        prompt (str): The user's startup idea description.
+        ideas_queue (asyncio.Queue): The queue that receives each domain name idea (without TLDs).
+        num_ideas (int): The number of ideas to generate.
+        model (str): The OpenAI model to use.
+        ideas_per_call (int): The maximum number of ideas to request from a single completion.
+    """
+    logger.info(f"\nAsking AI for startup name ideas for: '{prompt}'...")
+    try:
+        batch_sizes = [min(ideas_per_call, num_ideas - i) for i in range(0, num_ideas, ideas_per_call)]
+        counts = await asyncio.gather(*(_stream_domain_ideas(prompt, ideas_queue, size, model) for size in batch_sizes))
+        logger.info(f"AI generated {sum(counts)} ideas.")
+    finally:
+        await ideas_queue.put(None)
 
 # --- Main Application Logic ---
 
+async def search_ideas(client: InstantDomainsClient, ideas: List[str], allowed_tlds: Set[str], get_suggestions: bool, semaphore: asyncio.Semaphore) -> List[DomainSearchResults]:
+    """
+    Checks the availability of a batch of domain name ideas.
+
+    Args:
+        client (InstantDomainsClient): The warmed up InstantDomains client.
+        ideas (List[str]): The domain name ideas (without TLDs) to check.
+        allowed_tlds (Set[str]): A set of allowed TLDs to check (e.g., {'.com', '.io'}).
+        get_suggestions (bool): If True, fetches additional domain suggestions from InstantDomains.
+        semaphore (asyncio.Semaphore): Bounds the searches in flight across all batches.
+
+    Returns:
+        List[DomainSearchResults]: The search results for each idea.
+    """
+    if not get_suggestions:
+        # Batches are sized to fill one verisign check, so this bounds the bulk requests in flight
+        async with semaphore:
+            return await client.domain_search.bulk_search(ideas, allowed_tlds)
+
+    async def bounded_search(idea: str) -> DomainSearchResults:
+        async with semaphore:
+            return await client.domain_search.search(idea, allowed_tlds, get_suggestions=True)
+
+    # Suggestions are only available through a full search per idea; a failed idea must not drop the others
+    results = await asyncio.gather(*(bounded_search(idea) for idea in ideas), return_exceptions=True)
+    for res in results:
+        if isinstance(res, Exception):
+            logger.error(f"Error during domain search: {res}", exc_info=False)
+    return [res for res in results if not isinstance(res, Exception)]
+
 async def main(startup_idea: str, allowed_tlds: Set[str], only_show_available: bool, get_suggestions: bool, num_ideas: int):
     """
     Main runner to find, filter, and sort startup domain names using AI and the InstantDomainsSDK.
@@ -102,53 +228,72 @@ async def main(startup_idea: str, allowed_tlds: Set[str], only_show_available: b
     """
     logger.info("--- Startup Domain Name Finder ---")
 
-    # 1. Get initial ideas from AI
-    ideas_from_gpt = get_domain_ideas(startup_idea, num_ideas=num_ideas)
-    if not ideas_from_gpt:
-        logger.error("Could not generate initial ideas. Exiting.")
+    if not allowed_tlds:
+        logger.error("No TLDs to check. Add at least one to ALLOWED_TLDS.")
         return
 
-    # 2. Check domain availability using the SDK
-    client = InstantDomainsClient()
     all_results_data: Dict[str, Dict[str, Any]] = {}
 
-    try:
+    async with InstantDomainsClient() as client:
+        # 1. Stream ideas from AI, warming up the session while the first ideas are generated
+        ideas_queue: asyncio.Queue = asyncio.Queue()
+        ideas_task = asyncio.create_task(get_domain_ideas(startup_idea, ideas_queue, num_ideas=num_ideas))
         await client.warmup()
-        logger.info(f"\nChecking availability for {len(ideas_from_gpt)} names and suggestions...")
 
-        # Create concurrent tasks for all domain searches
-        tasks = [client.domain_search.search(idea, allowed_tlds, get_suggestions=get_suggestions) for idea in ideas_from_gpt]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Match whole TLDs only (e.g. '.com' but not '.common'), checked in a single endswith call
+        tld_suffixes = tuple(f".{tld.lstrip('.')}" for tld in allowed_tlds)
 
-        # Process results
-        for res in results:
-            if isinstance(res, Exception):
-                logger.error(f"Error during domain search: {res}", exc_info=False)
-                continue
+        # 2. Check domain availability using the SDK, starting a search as soon as a batch of ideas arrives
+        # Bound the searches in flight to avoid exhausting the connection pool or hitting rate limits
+        search_semaphore = asyncio.Semaphore(32)
+
+        async def search_and_process(ideas: List[str]):
+            try:
+                results = await search_ideas(client, ideas, allowed_tlds, get_suggestions, search_semaphore)
+            except Exception as e:
+                logger.error(f"Error during domain search: {e}", exc_info=False)
+                return
 
+            # Results are processed as soon as their search completes, while ideas are still streaming in
             # Process main results (from AI idea + common TLDs)
-            for domain_info in res.main_results:
-                if any(domain_info.domain.endswith(tld) for tld in allowed_tlds):
-                    all_results_data[domain_info.domain] = {
-                        "source": "AI-Generated",
-                        "available": domain_info.is_available
-                    }
-            
+            for domain_info in chain.from_iterable(res.main_results for res in results):
+                domain = domain_info.domain
+                if domain.endswith(tld_suffixes):
+                    all_results_data[domain] = {"source": "AI-Generated", "available": domain_info.is_available}
+
             # Process suggested results (from InstantDomains)
-            for domain_info in res.suggested_results:
-                if any(domain_info.domain.endswith(tld) for tld in allowed_tlds):
+            for domain_info in chain.from_iterable(res.suggested_results for res in results):
+                domain = domain_info.domain
+                if domain.endswith(tld_suffixes):
                     # Avoid overwriting if already present from main results
-                    if domain_info.domain not in all_results_data:
-                         all_results_data[domain_info.domain] = {
-                            "source": "InstantDomains Suggestion",
-                            "available": domain_info.is_available
-                        }
-        
+                    all_results_data.setdefault(domain, {"source": "InstantDomains Suggestion", "available": domain_info.is_available})
+
+        tasks = []
+        seen_ideas: Set[str] = set()
+        pending_ideas: List[str] = []
+        # Fill a single bulk availability check per batch; full searches with suggestions start per idea
+        ideas_per_batch = 1 if get_suggestions else max(1, 64 // len(allowed_tlds))
+        while (idea := await ideas_queue.get()) is not None:
+            # Concurrent completions can repeat each other's ideas
+            if idea in seen_ideas:
+                continue
+            seen_ideas.add(idea)
+            pending_ideas.append(idea)
+            if len(pending_ideas) == ideas_per_batch:
+                tasks.append(asyncio.create_task(search_and_process(pending_ideas)))
+                pending_ideas = []
+        if pending_ideas:
+            tasks.append(asyncio.create_task(search_and_process(pending_ideas)))
+        await ideas_task
+        if not tasks:
+            logger.error("Could not generate initial ideas. Exiting.")
+            return
+
+        logger.info(f"\nChecking availability for {len(seen_ideas)} names and suggestions...")
+        await asyncio.gather(*tasks)
+
         tld_str = ", ".join(allowed_tlds)
         logger.info(f"Checked {len(all_results_data)} total domains ending in {tld_str}.")
-
-    finally:
-        await client.close()
     
     if not all_results_data:
         logger.info("\nNo domains found. Try a different prompt.")
@@ -158,21 +303,7 @@ async def main(startup_idea: str, allowed_tlds: Set[str], only_show_available: b
     output_filename = "domain_results.csv"
     logger.info(f"\nWriting results to {output_filename}...")
     
-    # Prepare data for CSV
-    final_data = []
-    for domain, data in all_results_data.items():
-        if only_show_available and not data["available"]:
-            continue
-        final_data.append({
-            "Domain": domain,
-            "Source": data["source"],
-            "Status": "Available" if data["available"] else "Not Available"
-        })
-
-    # Sort alphabetically by domain name
-    final_data.sort(key=lambda x: x["Domain"])
-
-    if not final_data:
+    if only_show_available and not any(data["available"] for data in all_results_data.values()):
         logger.info("No domains matched the specified criteria (e.g., only available).")
         return
 
@@ -181,8 +312,18 @@ async def main(startup_idea: str, allowed_tlds: Set[str], only_show_available: b
             fieldnames = ["Domain", "Source", "Status"]
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(final_data)
-        logger.info(f"Successfully saved {len(final_data)} domains to {output_filename}.")
+            # Stream rows sorted alphabetically by domain name without building an intermediate list
+            num_written = 0
+            for domain, data in sorted(all_results_data.items()):
+                if only_show_available and not data["available"]:
+                    continue
+                writer.writerow({
+                    "Domain": domain,
+                    "Source": data["source"],
+                    "Status": "Available" if data["available"] else "Not Available"
+                })
+                num_written += 1
+        logger.info(f"Successfully saved {num_written} domains to {output_filename}.")
     except IOError:
         logger.exception(f"Error writing to file {output_filename}.")
 
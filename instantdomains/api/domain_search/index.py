@@ -1,5 +1,12 @@
-from typing import TYPE_CHECKING, List, Set
-import ctypes
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+from urllib.parse import quote
+import diskcache
+import httpx
+import orjson
 from .models import DomainInfo, DomainSearchResults
 
 if TYPE_CHECKING:
@@ -9,19 +16,40 @@ class DomainSearchAPI:
     """
     API for searching domain availability and getting suggestions.
     """
-    def __init__(self, client: "InstantDomainsClient"):
+    def __init__(self, client: "InstantDomainsClient", cache_dir: Optional[str] = ".id_cache", cache_expire: float = 3600):
         """
         Initializes the DomainSearchAPI.
 
         Args:
             client ("InstantDomainsClient"): The main client instance.
+            cache_dir (Optional[str]): Directory of the on-disk availability cache, or None to disable caching.
+            cache_expire (float): Seconds before a cached availability lookup expires.
         """
         self.client = client
-        self.common_tlds = "com,net,org,ai,io,xyz,app,shop,info,co,store,site,online,dev,tech,pro,live,lol,club,vip,link,top,me,tv,blog,cloud,design,studio,art,fun,one,world,digital,global,space,plus,media,email,host,page,ltd,biz,agency,social,stream,zone,web,team,work,life,love,best,cool,today,guru,care,fit,marketing,luxury,solutions,services,money,consulting,bio"
+        # diskcache blocks on SQLite and keeps one connection per thread, so all cache I/O runs on a single worker thread
+        self._cache_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="instantdomains-cache") if cache_dir is not None else None
+        self.cache = self._cache_executor.submit(diskcache.Cache, cache_dir).result() if cache_dir is not None else None
+        self.cache_expire = cache_expire
+        self._common_tlds_tuple = (
+            "com", "net", "org", "ai", "io", "xyz", "app", "shop", "info", "co", "store", "site", "online",
+            "dev", "tech", "pro", "live", "lol", "club", "vip", "link", "top", "me", "tv", "blog", "cloud",
+            "design", "studio", "art", "fun", "one", "world", "digital", "global", "space", "plus", "media",
+            "email", "host", "page", "ltd", "biz", "agency", "social", "stream", "zone", "web", "team",
+            "work", "life", "love", "best", "cool", "today", "guru", "care", "fit", "marketing", "luxury",
+            "solutions", "services", "money", "consulting", "bio",
+        )
+        # O(1) membership checks, e.g. filtering results down to common TLDs
+        self.common_tlds_set = frozenset(self._common_tlds_tuple)
+        self.common_tlds_str = ",".join(self._common_tlds_tuple)
+        # Kept for callers that read the original comma-separated string
+        self.common_tlds = self.common_tlds_str
 
-    def _calculate_hash(self, s: str, seed: int = 0) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calculate_hash(s: str, seed: int = 0) -> str:
         """
         A Python implementation of the djb2-variant string hashing function.
+        Memoized per (s, seed) since it is a pure function.
         
         Args:
             s: The string to hash.
@@ -30,17 +58,94 @@ class DomainSearchAPI:
         Returns:
             The calculated hash as a string.
         """
-        # Use ctypes.c_int32 to mimic JavaScript's 32-bit signed integer behavior
-        hash_val = ctypes.c_int32(seed)
-        
-        for char in s:
-            char_code = ord(char)
-            # The core djb2-variant algorithm
-            temp_hash = (hash_val.value << 5) - hash_val.value + char_code
-            # Assigning back to .value truncates the result to a 32-bit signed integer
-            hash_val.value = temp_hash
-            
-        return str(hash_val.value)
+        hash_val = seed & 0xFFFFFFFF
+        # Iterating bytes yields the char codes directly; only ASCII bytes match their code points
+        char_codes = s.encode("ascii") if s.isascii() else map(ord, s)
+
+        for char_code in char_codes:
+            # The core djb2-variant algorithm, kept within 32 bits on every step
+            hash_val = ((hash_val << 5) - hash_val + char_code) & 0xFFFFFFFF
+
+        # Sign-extend once to mimic JavaScript's 32-bit signed integer behavior
+        if hash_val >= 0x80000000:
+            hash_val -= 0x100000000
+        return str(hash_val)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _normalize_tlds(tlds: frozenset) -> str:
+        """
+        Formats TLDs for the API calls, sorted so the same set always yields the same string.
+
+        Args:
+            tlds (frozenset): The TLDs to format (e.g., {".com", ".ai"}).
+
+        Returns:
+            The comma-separated TLDs without dots (e.g., "ai,com").
+        """
+        return ",".join(sorted(tld.strip('.') for tld in tlds))
+
+    async def _run_cache(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Runs a blocking cache operation on the cache worker thread.
+
+        Args:
+            func (Callable): The cache operation to run.
+            *args: Positional arguments for the operation.
+            **kwargs: Keyword arguments for the operation.
+
+        Returns:
+            Any: The result of the operation.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._cache_executor, lambda: func(*args, **kwargs))
+
+    async def _cache_get(self, key: tuple) -> Optional[Any]:
+        """
+        Reads a value from the availability cache.
+
+        Args:
+            key (tuple): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None on a miss or when caching is disabled.
+        """
+        if self.cache is None:
+            return None
+        return await self._run_cache(self.cache.get, key)
+
+    async def _cache_set(self, key: tuple, value: Any, label: str):
+        """
+        Stores a value in the availability cache, tagged with its label for invalidation.
+
+        Args:
+            key (tuple): The cache key.
+            value (Any): The value to store.
+            label (str): The searched label the value belongs to.
+        """
+        if self.cache is not None:
+            await self._run_cache(self.cache.set, key, value, expire=self.cache_expire, tag=label)
+
+    async def close(self):
+        """
+        Closes the availability cache, if any.
+        """
+        if self.cache is not None:
+            await self._run_cache(self.cache.close)
+            self._cache_executor.shutdown()
+
+    async def invalidate_domain(self, domain_name: str) -> int:
+        """
+        Removes every cached lookup for a domain name.
+
+        Args:
+            domain_name (str): The domain name to invalidate (e.g., "example").
+
+        Returns:
+            int: The number of cache entries removed.
+        """
+        if self.cache is None:
+            return 0
+        return await self._run_cache(self.cache.evict, domain_name.partition('.')[0].lower())
 
     def _parse_zone_results(self, json_data: dict) -> List[DomainInfo]:
         """
@@ -50,7 +155,7 @@ class DomainSearchAPI:
             json_data (dict): The JSON data from the API response.
 
         Returns:
-            List[DomainInfo]: A list of Pydantic models for each domain.
+            List[DomainInfo]: A list of dataclasses for each domain.
         """
         results = []
         for item in json_data.get("results", []):
@@ -67,14 +172,45 @@ class DomainSearchAPI:
             json_data (dict): The JSON data from the API response.
 
         Returns:
-            List[DomainInfo]: A list of Pydantic models for each domain.
+            List[DomainInfo]: A list of dataclasses for each domain.
         """
         results = []
         for item in json_data.get("data", {}).get("results", []):
+            if not item.get("name"):
+                continue
             is_available = item.get("availability") == "available"
-            results.append(DomainInfo(domain=item.get("name"), is_available=is_available))
+            results.append(DomainInfo(domain=item["name"], is_available=is_available))
         return results
 
+    async def _verisign_check(self, label: str, names: List[str], tlds_str: str) -> List[DomainInfo]:
+        """
+        Bulk checks the availability of fully qualified domain names via the /services/verisign/check endpoint.
+
+        Args:
+            label (str): The searched label the check is made on behalf of.
+            names (List[str]): The domain names to check (e.g., ["example.com", "example.ai"]).
+            tlds_str (str): The comma-separated TLDs of the search (e.g., "com,ai").
+
+        Returns:
+            List[DomainInfo]: A list of dataclasses for each domain.
+        """
+        verisign_url = "/services/verisign/check"
+        # This hash must be calculated with a seed of 27 for the verisign check
+        verisign_hash = self._calculate_hash(label, 27)
+        data = {
+            "hash": verisign_hash,
+            "names": ",".join(names),
+            "search": label,
+            "tlds": tlds_str
+        }
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Accept": "*/*",
+            "Referer": f"{self.client.BASE_URL}/"
+        }
+        verisign_response = await self.client._request("POST", verisign_url, content=str(httpx.QueryParams(data)), headers=headers)
+        return self._parse_verisign_results(orjson.loads(verisign_response.content))
+
     async def search(self, domain_name: str, tlds: Set[str], get_suggestions: bool = True) -> DomainSearchResults:
         """
         Retrieves the availability of a domain across multiple TLDs and gets suggestions.
@@ -85,49 +221,103 @@ class DomainSearchAPI:
             get_suggestions (bool): Whether to fetch additional suggestions from InstantDomains.
 
         Returns:
-            DomainSearchResults: A Pydantic model containing the search results.
+            DomainSearchResults: A dataclass containing the search results.
         """
-        label = domain_name.split('.')[0]
+        label = domain_name.partition('.')[0]
         # This hash is used for the zone-names and fix endpoints
         domain_hash = self._calculate_hash(label, 42)
         
-        # Format TLDs for the API call (e.g., {".com", ".ai"} -> "com,ai")
-        tlds_str = ",".join(tld.strip('.') for tld in tlds)
+        # Format TLDs for the API call (e.g., {".com", ".ai"} -> "ai,com")
+        tlds_str = self._normalize_tlds(frozenset(tlds))
+
+        # Domain names are case-insensitive, so cache entries are keyed and tagged by lowercased label
+        cache_label = label.lower()
+        cache_key = ("search", cache_label, tlds_str, get_suggestions)
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return DomainSearchResults.from_dict({**cached, "query": domain_name})
 
         # 1. Get main TLD variations
-        zone_url = f"/services/zone-names/{label}?hash={domain_hash}&limit=64&city=Houston&country=US&tlds={tlds_str}"
-        zone_response = await self.client._request("GET", zone_url)
-        main_results = self._parse_zone_results(zone_response.json())
+        zone_url = f"/services/zone-names/{quote(label, safe='')}"
+        zone_params = {"hash": domain_hash, "limit": 64, "city": "Houston", "country": "US", "tlds": tlds_str}
+        zone_response = await self.client._request("GET", zone_url, params=zone_params)
+        main_results = self._parse_zone_results(orjson.loads(zone_response.content))
         
         suggested_results = []
         if get_suggestions:
             # 2. Get suggested domain names
-            fix_url = f"/services/fix/{label}?hash={domain_hash}&limit=32&city=Houston&country=US&tlds={tlds_str}"
-            fix_response = await self.client._request("GET", fix_url)
-            suggestions = fix_response.json().get("results", [])
+            fix_url = f"/services/fix/{quote(label, safe='')}"
+            fix_params = {"hash": domain_hash, "limit": 32, "city": "Houston", "country": "US", "tlds": tlds_str}
+            fix_response = await self.client._request("GET", fix_url, params=fix_params)
+            suggestions = orjson.loads(fix_response.content).get("results", [])
             suggested_names = [s.get("label") + "." + s.get("tld") for s in suggestions if s.get("label") and s.get("tld")]
 
             # 3. Bulk check availability of suggestions
             if suggested_names:
-                verisign_url = "/services/verisign/check"
-                # This hash must be calculated with a seed of 27 for the verisign check
-                verisign_hash = self._calculate_hash(label, 27) 
-                data = {
-                    "hash": verisign_hash,
-                    "names": ",".join(suggested_names),
-                    "search": label,
-                    "tlds": tlds_str
-                }
-                headers = {
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "Accept": "*/*",
-                    "Referer": f"{self.client.BASE_URL}/"
-                }
-                verisign_response = await self.client._request("POST", verisign_url, data=data, headers=headers)
-                suggested_results = self._parse_verisign_results(verisign_response.json())
-
-        return DomainSearchResults(
+                suggested_results = await self._verisign_check(label, suggested_names, tlds_str)
+
+        results = DomainSearchResults(
             query=domain_name,
             main_results=main_results,
             suggested_results=suggested_results,
         )
+        # As in bulk_search, an empty result is more likely a mismatch than a real answer, so don't cache it
+        if main_results or suggested_results:
+            await self._cache_set(cache_key, asdict(results), cache_label)
+        return results
+
+    async def bulk_search(self, domain_names: List[str], tlds: Set[str], batch_size: int = 64) -> List[DomainSearchResults]:
+        """
+        Retrieves the availability of many domains across multiple TLDs using batched verisign checks.
+        This avoids a zone-names request per domain, but does not fetch suggestions.
+
+        Args:
+            domain_names (List[str]): The domain names to search for (e.g., ["example", "sample"]).
+            tlds (Set[str]): A set of TLDs to search for (e.g., {".com", ".ai"}).
+            batch_size (int): The maximum number of names sent in a single verisign check.
+
+        Returns:
+            List[DomainSearchResults]: A dataclass per unique domain name, in the given order, with only main results.
+
+        Raises:
+            ValueError: If no TLDs are given.
+        """
+        if not tlds:
+            raise ValueError("bulk_search requires at least one TLD.")
+
+        # Domain names are case-insensitive, so results are requested and matched by lowercased label
+        labels = {domain_name: domain_name.partition('.')[0].lower() for domain_name in domain_names}
+        tlds_str = self._normalize_tlds(frozenset(tlds))
+
+        # Serve what we can from the cache and only check the remaining labels
+        results_by_label: Dict[str, List[DomainInfo]] = {}
+        uncached_labels = []
+        unique_labels = list(dict.fromkeys(labels.values()))
+        cached_results = await asyncio.gather(*(self._cache_get(("bulk", label, tlds_str)) for label in unique_labels))
+        for label, cached in zip(unique_labels, cached_results):
+            if cached is not None:
+                results_by_label[label] = [DomainInfo(**info) for info in cached]
+            else:
+                results_by_label[label] = []
+                uncached_labels.append(label)
+
+        # Check every label.tld combination, batch_size names per request
+        names = [f"{label}.{tld}" for label in uncached_labels for tld in tlds_str.split(",")]
+        batches = [names[i:i + batch_size] for i in range(0, len(names), batch_size)]
+        batch_results = await asyncio.gather(
+            *(self._verisign_check(batch[0].partition('.')[0], batch, tlds_str) for batch in batches)
+        )
+
+        for batch_result in batch_results:
+            for domain_info in batch_result:
+                results_by_label.setdefault(domain_info.domain.partition('.')[0].lower(), []).append(domain_info)
+        # An empty result is more likely a mismatch than a real answer, so don't cache it
+        await asyncio.gather(*(
+            self._cache_set(("bulk", label, tlds_str), [asdict(info) for info in results_by_label[label]], label)
+            for label in uncached_labels if results_by_label[label]
+        ))
+
+        return [
+            DomainSearchResults(query=domain_name, main_results=results_by_label.get(label, []))
+            for domain_name, label in labels.items()
+        ]
@@ -1,17 +1,30 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
 
-class DomainInfo(BaseModel):
+@dataclass(slots=True)
+class DomainInfo:
     """
-    Pydantic model representing the status of a single domain.
+    Dataclass representing the status of a single domain.
     """
     domain: str
     is_available: bool
 
-class DomainSearchResults(BaseModel):
+@dataclass(slots=True)
+class DomainSearchResults:
     """
-    Pydantic model for holding all domain search results.
+    Dataclass for holding all domain search results.
     """
     query: str
-    main_results: List[DomainInfo] = Field(default_factory=list)
-    suggested_results: List[DomainInfo] = Field(default_factory=list)
\ No newline at end of file
+    main_results: List[DomainInfo] = field(default_factory=list)
+    suggested_results: List[DomainInfo] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DomainSearchResults":
+        """
+        Rebuilds search results from their `dataclasses.asdict` form (e.g., when read from a cache).
+        """
+        return cls(
+            query=data["query"],
+            main_results=[DomainInfo(**info) for info in data.get("main_results", [])],
+            suggested_results=[DomainInfo(**info) for info in data.get("suggested_results", [])],
+        )
\ No newline at end of file
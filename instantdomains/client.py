@@ -1,6 +1,8 @@
+import asyncio
 import httpx
 import logging
 import traceback
+from typing import Optional
 from urllib.parse import urljoin
 
 from .api.domain_search.index import DomainSearchAPI
@@ -18,28 +20,43 @@ class InstantDomainsClient:
     BASE_URL = "https://instantdomainsearch.com"
     API_BASE_URL = "https://api.instantdomainsearch.com"
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, cache_dir: Optional[str] = ".id_cache", cache_expire: float = 3600):
         """
         Initializes the InstantDomainsClient.
+
+        Args:
+            client (Optional[httpx.AsyncClient]): An existing client to reuse, e.g. to share one session across many searches.
+                It should use `BASE_URL` as its base URL. It is not closed by `close()`.
+            cache_dir (Optional[str]): Directory of the on-disk availability cache, or None to disable caching.
+            cache_expire (float): Seconds before a cached availability lookup expires.
         """
-        self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br, zstd",
-                "Sec-Ch-Ua": '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-                "Sec-Ch-Ua-Mobile": "?0",
-                "Sec-Ch-Ua-Platform": '"Windows"',
-                "Connection": "keep-alive",
-            },
-            follow_redirects=True,
-            timeout=30.0,
-        )
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers={
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+                    "Accept-Language": "en-US,en;q=0.9",
+                    "Accept-Encoding": "gzip, deflate, br, zstd",
+                    "Sec-Ch-Ua": '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
+                    "Sec-Ch-Ua-Mobile": "?0",
+                    "Sec-Ch-Ua-Platform": '"Windows"',
+                    "Connection": "keep-alive",
+                },
+                follow_redirects=True,
+                timeout=30.0,
+                # HTTP/2 multiplexes concurrent searches over few connections; retries cover transient connect failures
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30.0),
+                    retries=2,
+                ),
+            )
+        self.client = client
 
         # Initialize API modules
-        self.domain_search = DomainSearchAPI(self)
+        self.domain_search = DomainSearchAPI(self, cache_dir=cache_dir, cache_expire=cache_expire)
 
     async def warmup(self):
         """
@@ -50,13 +67,13 @@ class InstantDomainsClient:
         await self._request("GET", "/")
         logger.debug("Initial cookies set from main page.")
         
-        # Geography service call
+        # Geography and auth session calls only depend on the main page cookies, so run them concurrently
         geography_url = urljoin(self.API_BASE_URL, "/services/geography")
-        await self._request("GET", geography_url, headers={"Referer": f"{self.BASE_URL}/"})
-        
-        # Auth session call
         auth_session_url = urljoin(self.API_BASE_URL, "/services/auth/session")
-        await self._request("GET", auth_session_url, headers={"Referer": f"{self.BASE_URL}/"})
+        await asyncio.gather(
+            self._request("GET", geography_url, headers={"Referer": f"{self.BASE_URL}/"}),
+            self._request("GET", auth_session_url, headers={"Referer": f"{self.BASE_URL}/"}),
+        )
 
         logger.info("Session warmup complete.")
 
@@ -88,7 +105,22 @@ class InstantDomainsClient:
 
     async def close(self):
         """
-        Closes the httpx client session.
+        Closes the availability cache and the httpx client session, unless the session was provided by the caller.
         """
+        await self.domain_search.close()
+        if not self._owns_client:
+            return
         await self.client.aclose()
-        logger.debug("HTTP client session closed.")
\ No newline at end of file
+        logger.debug("HTTP client session closed.")
+
+    async def __aenter__(self) -> "InstantDomainsClient":
+        """
+        Enters the client context, reusing the same session for every request inside it.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Exits the client context and closes the session.
+        """
+        await self.close()
\ No newline at end of file
@@ -0,0 +1,99 @@
+import tempfile
+import unittest
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+import orjson
+
+from instantdomains.api.domain_search.index import DomainSearchAPI
+
+
+class StubClient:
+    """
+    Stands in for InstantDomainsClient, answering zone-names and verisign checks with lowercased names.
+    """
+    BASE_URL = "https://instantdomainsearch.com"
+
+    def __init__(self):
+        self.requests = []
+
+    async def _request(self, method: str, url: str, **kwargs):
+        self.requests.append((method, url, kwargs))
+        if method == "GET":
+            # zone-names lookup made by search()
+            label = url.rsplit("/", 1)[-1].lower()
+            tlds = kwargs["params"]["tlds"].split(",")
+            results = [] if label == "missing" else [{"label": label, "tld": tld, "isRegistered": False} for tld in tlds]
+            return SimpleNamespace(content=orjson.dumps({"results": results}))
+        names = parse_qs(kwargs["content"])["names"][0].split(",")
+        results = [{"name": name.lower(), "availability": "available"} for name in names]
+        # Rows without a name must be ignored rather than break the parsing
+        results.append({"availability": "available"})
+        return SimpleNamespace(content=orjson.dumps({"data": {"results": results}}))
+
+
+class BulkSearchTest(unittest.IsolatedAsyncioTestCase):
+    async def test_matches_results_case_insensitively(self):
+        client = StubClient()
+        api = DomainSearchAPI(client, cache_dir=None)
+
+        results = await api.bulk_search(["CargoFlow", "zenith"], {".com", "ai"})
+
+        self.assertEqual([res.query for res in results], ["CargoFlow", "zenith"])
+        self.assertEqual(
+            sorted(info.domain for info in results[0].main_results),
+            ["cargoflow.ai", "cargoflow.com"],
+        )
+        self.assertEqual(
+            sorted(info.domain for info in results[1].main_results),
+            ["zenith.ai", "zenith.com"],
+        )
+        self.assertEqual(len(client.requests), 1)
+
+    async def test_rejects_empty_tlds(self):
+        api = DomainSearchAPI(StubClient(), cache_dir=None)
+
+        with self.assertRaises(ValueError):
+            await api.bulk_search(["zenith"], set())
+
+    async def test_invalidate_domain_ignores_case(self):
+        client = StubClient()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            api = DomainSearchAPI(client, cache_dir=cache_dir)
+            try:
+                await api.bulk_search(["CargoFlow"], {"com"})
+                await api.bulk_search(["CargoFlow"], {"com"})
+                self.assertEqual(len(client.requests), 1)
+
+                self.assertEqual(await api.invalidate_domain("CargoFlow"), 1)
+                await api.bulk_search(["cargoflow"], {"com"})
+                self.assertEqual(len(client.requests), 2)
+            finally:
+                await api.close()
+
+    async def test_invalidate_domain_clears_mixed_case_search(self):
+        client = StubClient()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            api = DomainSearchAPI(client, cache_dir=cache_dir)
+            try:
+                await api.search("CargoFlow", {"com"}, get_suggestions=False)
+                self.assertEqual(await api.invalidate_domain("cargoflow"), 1)
+                await api.search("CargoFlow", {"com"}, get_suggestions=False)
+                self.assertEqual(len(client.requests), 2)
+            finally:
+                await api.close()
+
+    async def test_search_does_not_cache_empty_results(self):
+        client = StubClient()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            api = DomainSearchAPI(client, cache_dir=cache_dir)
+            try:
+                await api.search("missing", {"com"}, get_suggestions=False)
+                await api.search("missing", {"com"}, get_suggestions=False)
+                self.assertEqual(len(client.requests), 2)
+            finally:
+                await api.close()
+
+
+if __name__ == "__main__":
+    unittest.main()